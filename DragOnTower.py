@@ -14,9 +14,10 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
-from typing import Optional
+from typing import Iterator, Optional, Tuple
+from weakref import WeakSet, ref
 
-from PyQt6.QtCore import QObject
+from PyQt6.QtCore import QObject, QTimer
 
 from UM.Extension import Extension
 from UM.Application import Application
@@ -27,9 +28,6 @@ from UM.Scene.Selection import Selection
 from UM.Math.Vector import Vector
 from UM.Math.Quaternion import Quaternion
 from UM.Math.Color import Color
-from UM.Operations.GravityOperation import GravityOperation
-from UM.Resources import Resources
-from UM.View.GL.OpenGL import OpenGL
 
 from cura.Settings.ExtruderManager import ExtruderManager
 from cura.Scene.SliceableObjectDecorator import SliceableObjectDecorator
@@ -38,11 +36,69 @@ from cura.Settings.SettingOverrideDecorator import SettingOverrideDecorator
 from .PrimeTowerMeshBuilder import PrimeTowerMeshBuilder
 
 
+# Decoration calls that are blocked on the prime tower representation
+_BLOCKED_DECOR_FUNCS = frozenset({"getStack", "setActiveExtruder", "getActiveExtruder"})
+
+# Settings that affect mesh geometry (require regeneration)
+_MESH_GEOMETRY_SETTINGS = frozenset({
+    "prime_tower_size",
+    "prime_tower_base_size",
+    "prime_tower_base_height",
+    "prime_tower_base_curve_magnitude",
+    "layer_height"
+})
+
+# Settings that only affect position
+_POSITION_SETTINGS = frozenset({
+    "prime_tower_position_x",
+    "prime_tower_position_y"
+})
+
+# Settings that affect which extruders are in use
+_EXTRUDER_USAGE_SETTINGS = frozenset({
+    "support_enable",
+    "support_extruder_nr",
+    "support_infill_extruder_nr",
+    "support_interface_extruder_nr",
+    "adhesion_extruder_nr",
+    "adhesion_type",
+    "raft_base_extruder_nr",
+    "raft_interface_extruder_nr",
+    "raft_surface_extruder_nr",
+    "skirt_brim_extruder_nr",
+    "extruders_enabled_count"
+})
+
+# PrimeTowerMeshBuilder builds every tower upward from local Y = 0
+_TOWER_MESH_BOTTOM_Y = 0.0
+
+
 class ProtectedSceneNode(SceneNode):
     """SceneNode that blocks decorator and child node additions to prevent unwanted modifications."""
     
     shader = None  # Shared shader for all prime tower instances
     collision_detected = False  # Track collision state for color changes
+    _last_color_state: Optional[bool] = None  # Collision state last uploaded to the shader
+    
+    _COLLISION_COLOR = Color(1.0, 0.0, 0.0, 1.0)  # Red when colliding
+    _VALID_COLOR = Color(0.0, 0.8, 0.9, 1.0)  # Cyan when valid
+    
+    _BATCH_NAME = "prime_tower_visual"  # Render batch shared by all prime tower instances
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        
+        # Render inputs, cached until the node is transformed or its mesh is replaced
+        self._cached_world_transformation = None
+        self._cached_mesh_data = None
+        self.transformationChanged.connect(self._invalidateCachedTransformation)
+        self.meshDataChanged.connect(self._invalidateCachedMeshData)
+    
+    def _invalidateCachedTransformation(self, node: SceneNode) -> None:
+        self._cached_world_transformation = None
+    
+    def _invalidateCachedMeshData(self, node: SceneNode) -> None:
+        self._cached_mesh_data = None
     
     def addDecorator(self, decorator: SceneNodeDecorator) -> None:
         if isinstance(decorator, (SliceableObjectDecorator, SettingOverrideDecorator)):
@@ -56,8 +112,7 @@ class ProtectedSceneNode(SceneNode):
     
     def callDecoration(self, function: str, *args, **kwargs):
         """Block settings-related decoration calls."""
-        blocked_functions = ["getStack", "setActiveExtruder", "getActiveExtruder"]
-        if function in blocked_functions:
+        if function in _BLOCKED_DECOR_FUNCS:
             return None
         
         return super().callDecoration(function, *args, **kwargs)
@@ -65,29 +120,42 @@ class ProtectedSceneNode(SceneNode):
     def render(self, renderer):
         """Custom render method to apply cyan color to prime tower with proper shading."""
         if not ProtectedSceneNode.shader:
+            # Imported here so loading the plugin does not pull in the OpenGL layer
+            from UM.Resources import Resources
+            from UM.View.GL.OpenGL import OpenGL
+            
             ProtectedSceneNode.shader = OpenGL.getInstance().createShaderProgram(
                 Resources.getPath(Resources.Shaders, "object.shader"))
+            ProtectedSceneNode._last_color_state = None
 
-        # Change color based on collision state
-        if ProtectedSceneNode.collision_detected:
-            color = Color(1.0, 0.0, 0.0, 1.0)  # Red when colliding
-        else:
-            color = Color(0.0, 0.8, 0.9, 1.0)  # Cyan when valid
+        # Change color based on collision state, only uploading the uniform when it changes
+        collision_detected = ProtectedSceneNode.collision_detected
+        if ProtectedSceneNode._last_color_state != collision_detected:
+            color = ProtectedSceneNode._COLLISION_COLOR if collision_detected else ProtectedSceneNode._VALID_COLOR
+            ProtectedSceneNode.shader.setUniformValue("u_diffuseColor", color)
+            ProtectedSceneNode._last_color_state = collision_detected
         
-        ProtectedSceneNode.shader.setUniformValue("u_diffuseColor", color)
-        
-        batch = renderer.getNamedBatch("prime_tower_visual")
+        # The renderer drops its batches at the start of every frame, so the batch
+        # cannot be kept across frames; look it up once per frame and share it
+        batch = renderer.getNamedBatch(ProtectedSceneNode._BATCH_NAME)
         if not batch:
             batch = renderer.createRenderBatch(shader=ProtectedSceneNode.shader)
-            renderer.addRenderBatch(batch, name="prime_tower_visual")
+            renderer.addRenderBatch(batch, name=ProtectedSceneNode._BATCH_NAME)
+        
+        if self._cached_world_transformation is None:
+            self._cached_world_transformation = self.getWorldTransformation(copy=False)
+        if self._cached_mesh_data is None:
+            self._cached_mesh_data = self.getMeshData()
         
-        batch.addItem(self.getWorldTransformation(copy=False), self.getMeshData())
+        batch.addItem(self._cached_world_transformation, self._cached_mesh_data)
         return True
 
 
 class NonSliceableDecorator(SceneNodeDecorator):
     """Marks node as non-sliceable."""
     
+    __slots__ = ()
+    
     def __deepcopy__(self, memo):
         return NonSliceableDecorator()
     
@@ -101,6 +169,8 @@ class NonSliceableDecorator(SceneNodeDecorator):
 class PrimeTowerRepresentationDecorator(SceneNodeDecorator):
     """Identifies node as prime tower representation."""
     
+    __slots__ = ()
+    
     def __deepcopy__(self, memo):
         return PrimeTowerRepresentationDecorator()
     
@@ -111,6 +181,8 @@ class PrimeTowerRepresentationDecorator(SceneNodeDecorator):
 class TransformConstraintDecorator(SceneNodeDecorator):
     """Constrains transforms to prevent Z-axis movement."""
     
+    __slots__ = ()
+    
     def __deepcopy__(self, memo):
         return TransformConstraintDecorator()
 
@@ -128,10 +200,21 @@ class DragOnTower(Extension, QObject):
     
     # Transform constraint tolerance
     POSITION_TOLERANCE = 0.001
+    POSITION_TOLERANCE_SQ = POSITION_TOLERANCE ** 2
+    
+    # The tower is always upright and unscaled; scaling is folded into the size setting
+    _IDENTITY_ORIENTATION = Quaternion()
+    _UNIT_SCALE = Vector(1.0, 1.0, 1.0)
     
     # Minimum extruders required for prime tower
     MIN_EXTRUDERS_FOR_TOWER = 2
     
+    # Delay before re-checking model height after scene changes (ms)
+    HEIGHT_CHECK_DELAY_MS = 50
+    
+    # Delay used to coalesce tower transform changes into one settings write (ms, ~one frame)
+    SETTINGS_UPDATE_DELAY_MS = 16
+    
     def __init__(self):
         super().__init__()
         
@@ -139,11 +222,16 @@ class DragOnTower(Extension, QObject):
         self._controller = self._application.getController()
         self._scene = self._controller.getScene()
         
-        self._prime_tower_node: Optional[SceneNode] = None
+        self._prime_tower_ref: Optional[ref] = None  # Weak reference behind the _prime_tower_node property
+        self._all_prime_tower_nodes: WeakSet = WeakSet()  # Every live tower node this plugin created
+        # Whether the scene may hold tower nodes we did not create (leftovers or copies)
+        self._orphan_scan_needed: bool = True
         self._global_stack = None
+        self._global_stack_connected: bool = False
         self._settings_update_in_progress: bool = False
         self._creating_prime_tower: bool = False
         self._prime_tower_was_selected: bool = False
+        self._scale_tool_active: bool = False
         
         self._build_plate_y: float = 0.0
         self._original_mesh_diameter: float = 0.0
@@ -151,15 +239,60 @@ class DragOnTower(Extension, QObject):
         self._original_base_height: float = 0.0
         self._original_base_curve: float = 0.0
         self._original_max_height: float = 0.0
+        self._last_written_position: Optional[Tuple[float, float]] = None  # (x, y) settings we last wrote
         self._machine_width: float = self.DEFAULT_MACHINE_WIDTH
         self._machine_depth: float = self.DEFAULT_MACHINE_DEPTH
         self._machine_center_is_zero: bool = False
+        # Derived from the machine settings above by _recomputeMachineCache()
+        self._machine_half_width: float = 0.0
+        self._machine_half_depth: float = 0.0
+        self._machine_offset_x: float = 0.0  # Settings X minus scene X
+        self._machine_offset_z: float = 0.0  # Scene Z plus settings Y
+        self._recomputeMachineCache()
         
         # Track BuildVolume reference for reconnecting signals
         self._build_volume = None
+        self._build_volume_connected: bool = False
+        
+        # ExtruderManager only exists once Cura has started, so it is connected lazily
+        self._extruder_manager = None
+        self._extruder_manager_connected: bool = False
+        
+        # Track sliceable objects for height changes (weak so removed objects can be collected)
+        self._tracked_objects: WeakSet = WeakSet()
+        
+        # Coalesce bursts of scene/transform signals into a single height check
+        self._height_check_timer = QTimer()
+        self._height_check_timer.setSingleShot(True)
+        self._height_check_timer.setInterval(self.HEIGHT_CHECK_DELAY_MS)
+        self._height_check_timer.timeout.connect(self._doHeightCheck)
+        
+        # Coalesce tower transform changes during a drag into a single settings write
+        self._settings_update_pending: bool = False
+        self._pending_update_timer = QTimer()
+        self._pending_update_timer.setSingleShot(True)
+        self._pending_update_timer.setInterval(self.SETTINGS_UPDATE_DELAY_MS)
+        self._pending_update_timer.timeout.connect(self._flushPendingUpdate)
+        
+        # Scene traversal results (max model height, sliceable nodes), cached until the
+        # scene version is bumped by an object change
+        self._scene_version: int = 0
+        self._max_model_height: float = 0.0
+        self._max_model_height_version: int = -1
         
-        # Track sliceable objects for height changes
-        self._tracked_objects = set()
+        # Cached count of enabled extruders in use (None means it must be recomputed)
+        self._cached_enabled_extruder_count: Optional[int] = None
+        
+        # Setting key -> handler dispatch table for _onSettingValueChanged
+        self._setting_handlers = {
+            "machine_width": self._readMachineSettings,
+            "machine_depth": self._readMachineSettings,
+            "machine_center_is_zero": self._readMachineSettings,
+            "prime_tower_enable": self._checkAndCreatePrimeTowerNode
+        }
+        self._setting_handlers.update(dict.fromkeys(_MESH_GEOMETRY_SETTINGS, self._regenerateMesh))
+        self._setting_handlers.update(dict.fromkeys(_POSITION_SETTINGS, self._onPositionSettingChanged))
+        self._setting_handlers.update(dict.fromkeys(_EXTRUDER_USAGE_SETTINGS, self._onExtruderUsageChanged))
         
         # Scale tool deferred update state
         self._pending_scale_update: bool = False
@@ -167,13 +300,70 @@ class DragOnTower(Extension, QObject):
         self._pending_original_settings: Optional[tuple] = None  # (size, pos_x, pos_y) before scale operation
         
         self._application.globalContainerStackChanged.connect(self._onGlobalStackChanged)
-        self._application.getController().toolOperationStopped.connect(self._onToolOperationStopped)
+        self._controller.toolOperationStopped.connect(self._onToolOperationStopped)
+        self._controller.activeToolChanged.connect(self._onActiveToolChanged)
         self._scene.sceneChanged.connect(self._onSceneChanged)
-        self._scene.sceneChanged.connect(self._onSceneObjectsChanged)
         Selection.selectionChanged.connect(self._onSelectionChanged)
+        self._application.applicationShuttingDown.connect(self._onApplicationShuttingDown)
         
+        self._onActiveToolChanged()
         self._onGlobalStackChanged()
+    
+    @property
+    def _prime_tower_node(self) -> Optional[SceneNode]:
+        """The current prime tower node, or None if there is none or it has been garbage collected."""
+        return self._prime_tower_ref() if self._prime_tower_ref else None
+    
+    @_prime_tower_node.setter
+    def _prime_tower_node(self, node: Optional[SceneNode]) -> None:
+        self._prime_tower_ref = ref(node) if node is not None else None
+    
+    def _onApplicationShuttingDown(self):
+        """Disconnect all signals so no callbacks are dispatched to the plugin during teardown."""
+        self._height_check_timer.stop()
+        self._pending_update_timer.stop()
+        
+        connections = [
+            (self._application.globalContainerStackChanged, self._onGlobalStackChanged),
+            (self._controller.toolOperationStopped, self._onToolOperationStopped),
+            (self._controller.activeToolChanged, self._onActiveToolChanged),
+            (self._scene.sceneChanged, self._onSceneChanged),
+            (Selection.selectionChanged, self._onSelectionChanged),
+            (self._application.applicationShuttingDown, self._onApplicationShuttingDown)
+        ]
+        if self._global_stack_connected:
+            connections.append((self._global_stack.propertyChanged, self._onSettingValueChanged))
+            self._global_stack_connected = False
+        if self._build_volume_connected:
+            connections.append((self._build_volume.raftThicknessChanged, self._checkTowerCollision))
+            connections.append((self._build_volume.meshDataChanged, self._onBuildVolumeRebuilt))
+            self._build_volume_connected = False
+        if self._extruder_manager_connected:
+            connections.append((self._extruder_manager.extrudersChanged, self._onExtrudersChanged))
+            connections.append((self._extruder_manager.selectedObjectExtrudersChanged, self._onExtrudersChanged))
+            self._extruder_manager_connected = False
+        if self._prime_tower_node:
+            connections.append((self._prime_tower_node.transformationChanged, self._onNodeTransformChanged))
+        
+        for signal, handler in connections:
+            try:
+                signal.disconnect(handler)
+            except (RuntimeError, TypeError):
+                pass
+        
+        self._untrackAllObjects()
+    
+    def _untrackAllObjects(self):
+        """Stop listening to transform changes of every tracked sliceable object."""
+        for node in list(self._tracked_objects):
+            node.transformationChanged.disconnect(self._onSliceableObjectTransformed)
+        self._tracked_objects.clear()
 
+    def _onActiveToolChanged(self):
+        """Cache whether the scale tool is the active tool."""
+        active_tool = self._controller.getActiveTool()
+        self._scale_tool_active = bool(active_tool and active_tool.getPluginId() == "ScaleTool")
+    
     def _toggleTools(self, enable: bool):
         """Enable or disable incompatible tools based on prime tower selection."""
         tool_list = [
@@ -202,6 +392,9 @@ class DragOnTower(Extension, QObject):
         
         self._prime_tower_was_selected = is_prime_tower_selected
         self._toggleTools(not is_prime_tower_selected)
+        if is_prime_tower_selected:
+            # Copy, paste and multiply act on the selection and may duplicate the tower
+            self._orphan_scan_needed = True
     
     def _onGlobalStackChanged(self):
         """Handle global container stack changes (printer switching)."""
@@ -210,11 +403,9 @@ class DragOnTower(Extension, QObject):
         
         try:
             # Disconnect old stack signals
-            if self._global_stack:
-                try:
-                    self._global_stack.propertyChanged.disconnect(self._onSettingValueChanged)
-                except:
-                    pass
+            if self._global_stack and self._global_stack_connected:
+                self._global_stack.propertyChanged.disconnect(self._onSettingValueChanged)
+                self._global_stack_connected = False
             
             # Remove ALL prime tower mesh representations (including orphaned ones)
             self._removeAllPrimeTowerNodes()
@@ -232,7 +423,15 @@ class DragOnTower(Extension, QObject):
             self._pending_scale_update = False
             self._pending_scale_value = 1.0
             self._pending_original_settings = None
-            self._tracked_objects.clear()
+            # Drop updates queued for the previous printer so they are not written to the new stack
+            self._pending_update_timer.stop()
+            self._settings_update_pending = False
+            self._height_check_timer.stop()
+            self._untrackAllObjects()
+            self._scene_version += 1
+            PrimeTowerMeshBuilder.clearCache()
+            self._last_written_position = None
+            self._cached_enabled_extruder_count = None
             
             # Get new global stack
             self._global_stack = self._application.getGlobalContainerStack()
@@ -240,20 +439,31 @@ class DragOnTower(Extension, QObject):
             # Connect to new printer and generate prime tower
             if self._global_stack:
                 self._global_stack.propertyChanged.connect(self._onSettingValueChanged)
-                self._machine_width = self._global_stack.getProperty("machine_width", "value") or self.DEFAULT_MACHINE_WIDTH
-                self._machine_depth = self._global_stack.getProperty("machine_depth", "value") or self.DEFAULT_MACHINE_DEPTH
-                self._machine_center_is_zero = bool(self._global_stack.getProperty("machine_center_is_zero", "value"))
+                self._global_stack_connected = True
+                self._readMachineSettings()
                 
                 # Reconnect to the NEW BuildVolume for the new printer
-                if self._build_volume:
-                    try:
-                        self._build_volume.raftThicknessChanged.disconnect(self._checkTowerCollision)
-                    except:
-                        pass
+                build_volume = self._application.getBuildVolume()
+                if self._build_volume_connected and build_volume is not self._build_volume:
+                    self._build_volume.raftThicknessChanged.disconnect(self._checkTowerCollision)
+                    self._build_volume.meshDataChanged.disconnect(self._onBuildVolumeRebuilt)
+                    self._build_volume_connected = False
                 
-                self._build_volume = self._application.getBuildVolume()
-                if self._build_volume:
+                self._build_volume = build_volume
+                if self._build_volume and not self._build_volume_connected:
                     self._build_volume.raftThicknessChanged.connect(self._checkTowerCollision)
+                    # BuildVolume rebuilds its mesh after recomputing error areas
+                    self._build_volume.meshDataChanged.connect(self._onBuildVolumeRebuilt)
+                    self._build_volume_connected = True
+                
+                # Connect to the ExtruderManager once it exists (it is created after plugins load)
+                if not self._extruder_manager_connected:
+                    self._extruder_manager = ExtruderManager.getInstance()
+                    if self._extruder_manager:
+                        self._extruder_manager.extrudersChanged.connect(self._onExtrudersChanged)
+                        # Emitted when an object is moved to another extruder
+                        self._extruder_manager.selectedObjectExtrudersChanged.connect(self._onExtrudersChanged)
+                        self._extruder_manager_connected = True
         
         finally:
             # Turn signal back to normal
@@ -261,67 +471,70 @@ class DragOnTower(Extension, QObject):
         
         # Now create tower for new printer
         if self._global_stack:
+            self._trackSliceableObjects()
             self._checkAndCreatePrimeTowerNode()
     
     def _onSceneChanged(self, source: SceneNode):
-        """Update settings when prime tower node is modified."""
-        if not self._prime_tower_node or self._settings_update_in_progress:
-            return
+        """Sync settings when the prime tower node is modified, otherwise check if it should be recreated or hidden."""
+        if source is None or source is not self._prime_tower_node:
+            self._scene_version += 1
         
-        if self._prime_tower_node.getParent() is None:
-            self._prime_tower_node = None
-            return
-        
-        if source == self._prime_tower_node:
-            self._updateSettingsFromNode()
-    
-    def _onSceneObjectsChanged(self, source: SceneNode):
-        """Check if prime tower should be recreated or visibility changed."""
         if self._creating_prime_tower or self._settings_update_in_progress:
             return
         
         if self._prime_tower_node and self._prime_tower_node.getParent() is None:
             self._prime_tower_node = None
+        elif source is not None and source is self._prime_tower_node:
+            self._schedulePendingUpdate()
+            return
         
-        if source and source.callDecoration("isSliceable"):
-            self._checkAndCreatePrimeTowerNode()
+        is_sliceable = source is not None and source.callDecoration("isSliceable")
+        if is_sliceable:
             # Track this object's transformations to detect height changes
             if source not in self._tracked_objects:
                 self._tracked_objects.add(source)
-                try:
-                    source.transformationChanged.connect(self._onSliceableObjectTransformed)
-                except:
-                    pass
+                source.transformationChanged.connect(self._onSliceableObjectTransformed)
+                # A newly added object may use another extruder
+                self._cached_enabled_extruder_count = None
+            self._checkAndCreatePrimeTowerNode()
             # Check if max height changed (model added or moved)
             if self._prime_tower_node:
-                new_max_height = self._getMaxModelHeight()
-                if abs(new_max_height - self._original_max_height) > 0.01:  # Tolerance for floating point
-                    self._regenerateMesh()
+                self._height_check_timer.start()
         elif source and source.getParent() is None:
             # Object removed - stop tracking
             if source in self._tracked_objects:
                 self._tracked_objects.discard(source)
-                try:
-                    source.transformationChanged.disconnect(self._onSliceableObjectTransformed)
-                except:
-                    pass
+                source.transformationChanged.disconnect(self._onSliceableObjectTransformed)
+            self._cached_enabled_extruder_count = None
             self._checkAndCreatePrimeTowerNode()
+            # Removing the tallest model lowers the tower
+            if self._prime_tower_node:
+                self._height_check_timer.start()
         elif not self._prime_tower_node:
             self._checkAndCreatePrimeTowerNode()
     
     def _onSliceableObjectTransformed(self, node: SceneNode):
-        """Check if max height changed when a sliceable object is transformed.
+        """Schedule a height check when a sliceable object is transformed.
         
         This is connected to each sliceable object's transformationChanged signal
         to detect when models are moved, scaled, or rotated that might affect
         the required prime tower height.
         """
+        self._scene_version += 1
+        
+        if not self._prime_tower_node or self._settings_update_in_progress:
+            return
+        
+        self._height_check_timer.start()
+    
+    def _doHeightCheck(self):
+        """Regenerate the tower mesh if the maximum model height has changed."""
         if not self._prime_tower_node or self._settings_update_in_progress:
             return
         
         try:
             new_max_height = self._getMaxModelHeight()
-            if abs(new_max_height - self._original_max_height) > 0.01:
+            if abs(new_max_height - self._original_max_height) > 0.01:  # Tolerance for floating point
                 self._regenerateMesh()
         except Exception as e:
             Logger.log("w", "Error checking height change: %s", str(e))
@@ -333,6 +546,11 @@ class DragOnTower(Extension, QObject):
         scaled bounding box and updates both size and position settings to maintain
         the tower's center position.
         """
+        # Apply any coalesced transform first so a pending scale is registered
+        if self._pending_update_timer.isActive():
+            self._pending_update_timer.stop()
+            self._flushPendingUpdate()
+        
         if not (self._pending_scale_update and self._prime_tower_node and self._global_stack):
             return
         
@@ -341,57 +559,41 @@ class DragOnTower(Extension, QObject):
             stored_settings = self._pending_original_settings
             self._pending_original_settings = None
             
-            bbox = self._prime_tower_node.getBoundingBox()
-            if not bbox or stored_settings is None:
-                Logger.log("w", "Failed to apply scale: missing bounding box or stored settings")
+            footprint = self._getTowerFootprint()
+            if not footprint or stored_settings is None:
+                Logger.log("w", "Failed to apply scale: missing mesh extents or stored settings")
                 return
             
             original_size, original_pos_x, original_pos_y = stored_settings
             
-            # Calculate new tower size from scaled bounding box
-            # Bounding box includes the base, so subtract base margins from both sides
-            bbox_size = max(bbox.width, bbox.depth)
+            # Calculate new tower size from scaled footprint
+            # Footprint includes the base, so subtract base margins from both sides
             base_size = self._global_stack.getProperty("prime_tower_base_size", "value") or original_size
-            new_tower_size = bbox_size - (2 * base_size)
+            new_tower_size = footprint - (2 * base_size)
             
             # Ensure size is valid
             if new_tower_size <= 0:
                 Logger.log("w", "Invalid tower size after scale: %.2f", new_tower_size)
                 return
             
-            # Calculate center position from original settings
-            corner_x = original_pos_x
-            corner_z = -original_pos_y
-            if not self._machine_center_is_zero:
-                corner_x -= self._machine_width / 2
-                corner_z += self._machine_depth / 2
-            
-            original_radius = original_size / 2.0
-            center_x = corner_x - original_radius
-            center_z = corner_z - original_radius
-            
-            # Calculate new corner position to maintain center with new size
-            new_radius = new_tower_size / 2.0
-            new_corner_x = center_x + new_radius
-            new_corner_z = center_z + new_radius
-            
-            # Convert back to settings coordinates
-            new_pos_x = new_corner_x
-            new_pos_z = new_corner_z
-            if not self._machine_center_is_zero:
-                new_pos_x += self._machine_width / 2
-                new_pos_z -= self._machine_depth / 2
-            new_pos_y = -new_pos_z
-            
-            # Update both size and position atomically
+            # Keep the node position from the original settings and express it for the new size
+            scene_x, scene_z = self._settingsToScene(
+                original_pos_x, original_pos_y, original_size, self._machine_offset_x, self._machine_offset_z)
+            new_pos_x, new_pos_y = self._sceneToSettings(
+                scene_x, scene_z, new_tower_size, self._machine_offset_x, self._machine_offset_z)
+            
+            # Update both size and position; the stack collects the changes and notifies once
             self._settings_update_in_progress = True
             self._global_stack.setProperty("prime_tower_size", "value", new_tower_size)
             self._global_stack.setProperty("prime_tower_position_x", "value", new_pos_x)
             self._global_stack.setProperty("prime_tower_position_y", "value", new_pos_y)
+            self._last_written_position = (new_pos_x, new_pos_y)
             self._settings_update_in_progress = False
             
-            # Reset scale to 1.0 since we applied it to the setting
-            self._prime_tower_node.setScale(Vector(1.0, 1.0, 1.0))
+            # Reset scale to 1.0 since we applied it to the setting; the mesh is rebuilt
+            # once the stack reports the new prime_tower_size
+            if self._prime_tower_node.getScale() != self._UNIT_SCALE:
+                self._prime_tower_node.setScale(self._UNIT_SCALE)
             
         except Exception as e:
             Logger.log("e", "Error applying scale changes: %s", str(e))
@@ -399,68 +601,69 @@ class DragOnTower(Extension, QObject):
     
     def _onSettingValueChanged(self, key: str, property_name: str):
         """Update representation when relevant settings change."""
-        if property_name != "value":
+        # Ignore notifications raised while we are updating the node or settings
+        if self._settings_update_in_progress or property_name != "value":
             return
         
-        if key == "machine_width":
-            self._machine_width = self._global_stack.getProperty("machine_width", "value") or self.DEFAULT_MACHINE_WIDTH
-        elif key == "machine_depth":
-            self._machine_depth = self._global_stack.getProperty("machine_depth", "value") or self.DEFAULT_MACHINE_DEPTH
-        elif key == "machine_center_is_zero":
-            self._machine_center_is_zero = bool(self._global_stack.getProperty("machine_center_is_zero", "value"))
-        
-        # Settings that affect mesh geometry (require regeneration)
-        mesh_geometry_settings = [
-            "prime_tower_size",
-            "prime_tower_base_size",
-            "prime_tower_base_height",
-            "prime_tower_base_curve_magnitude",
-            "layer_height"
-        ]
-        
-        # Settings that only affect position
-        position_settings = [
-            "prime_tower_position_x",
-            "prime_tower_position_y"
-        ]
+        handler = self._setting_handlers.get(key)
+        if handler:
+            handler()
+    
+    def _readMachineSettings(self):
+        """Read machine dimensions and origin mode from the global stack, applying defaults."""
+        stack = self._global_stack
+        self._machine_width = stack.getProperty("machine_width", "value") or self.DEFAULT_MACHINE_WIDTH
+        self._machine_depth = stack.getProperty("machine_depth", "value") or self.DEFAULT_MACHINE_DEPTH
+        self._machine_center_is_zero = bool(stack.getProperty("machine_center_is_zero", "value"))
+        self._recomputeMachineCache()
+    
+    def _recomputeMachineCache(self):
+        """Recompute half machine dimensions and the settings/scene origin offsets."""
+        self._machine_half_width = self._machine_width * 0.5
+        self._machine_half_depth = self._machine_depth * 0.5
+        if self._machine_center_is_zero:
+            self._machine_offset_x = 0.0
+            self._machine_offset_z = 0.0
+        else:
+            self._machine_offset_x = self._machine_half_width
+            self._machine_offset_z = self._machine_half_depth
+    
+    def _onPositionSettingChanged(self):
+        """Move the node to a position that was changed outside the plugin.
         
-        extruder_usage_settings = [
-            "support_enable",
-            "support_extruder_nr",
-            "support_infill_extruder_nr",
-            "support_interface_extruder_nr",
-            "adhesion_extruder_nr",
-            "adhesion_type",
-            "raft_base_extruder_nr",
-            "raft_interface_extruder_nr",
-            "raft_surface_extruder_nr",
-            "skirt_brim_extruder_nr"
-        ]
+        The stack reports our own writes after they return, so those echoes are recognized by
+        comparing against the last written position and skipped.
+        """
+        last_position = self._last_written_position
+        if last_position is not None:
+            setting_x = self._global_stack.getProperty("prime_tower_position_x", "value")
+            setting_y = self._global_stack.getProperty("prime_tower_position_y", "value")
+            if (setting_x is not None and setting_y is not None
+                    and abs(setting_x - last_position[0]) <= self.POSITION_TOLERANCE
+                    and abs(setting_y - last_position[1]) <= self.POSITION_TOLERANCE):
+                return
         
-        if key == "prime_tower_enable":
-            self._checkAndCreatePrimeTowerNode()
-        elif key in mesh_geometry_settings:
-            if self._prime_tower_node:
-                self._regenerateMesh()
-        elif key in position_settings:
-            if self._prime_tower_node:
-                self._updateNodePosition()
-        elif key in extruder_usage_settings:
+        self._last_written_position = None
+        self._updateNodePosition()
+    
+    def _onExtrudersChanged(self, *args):
+        """Invalidate the cached extruder count when extruder stacks or object assignments change."""
+        self._cached_enabled_extruder_count = None
+        if not self._settings_update_in_progress:
             self._checkAndCreatePrimeTowerNode()
     
+    def _onExtruderUsageChanged(self):
+        """Invalidate the cached extruder count and re-evaluate tower visibility."""
+        self._cached_enabled_extruder_count = None
+        self._checkAndCreatePrimeTowerNode()
+    
     def _checkAndCreatePrimeTowerNode(self):
         """Create or remove prime tower node based on settings and extruder usage."""
         if not self._global_stack:
             return
         
         prime_tower_enabled = self._global_stack.getProperty("prime_tower_enable", "value")
-        
-        try:
-            used_extruders = ExtruderManager.getInstance().getUsedExtruderStacks()
-            enabled_used_extruder_count = len([x for x in used_extruders if x.isEnabled])
-        except Exception as e:
-            Logger.log("w", f"Failed to get extruder stacks: {e}")
-            enabled_used_extruder_count = 0
+        enabled_used_extruder_count = self._getEnabledUsedExtruderCount()
         
         should_show_tower = prime_tower_enabled and enabled_used_extruder_count >= self.MIN_EXTRUDERS_FOR_TOWER
         
@@ -469,8 +672,21 @@ class DragOnTower(Extension, QObject):
         elif not should_show_tower and self._prime_tower_node:
             self._removePrimeTowerNode()
     
+    def _getEnabledUsedExtruderCount(self) -> int:
+        """Return the number of enabled extruders in use, reusing the cached value when valid."""
+        if self._cached_enabled_extruder_count is None:
+            try:
+                used_extruders = ExtruderManager.getInstance().getUsedExtruderStacks()
+            except Exception as e:
+                Logger.log("w", f"Failed to get extruder stacks: {e}")
+                return 0
+            self._cached_enabled_extruder_count = len([x for x in used_extruders if x.isEnabled])
+        
+        return self._cached_enabled_extruder_count
+    
     def _createPrimeTowerNode(self):
         """Create the visual prime tower node."""
+        was_updating = self._settings_update_in_progress
         self._settings_update_in_progress = True
         self._creating_prime_tower = True
         
@@ -487,6 +703,7 @@ class DragOnTower(Extension, QObject):
             protected_node.setName("Prime Tower Visual")
             
             self._prime_tower_node = protected_node
+            self._all_prime_tower_nodes.add(protected_node)
             
             self._prime_tower_node.addDecorator(NonSliceableDecorator())
             self._prime_tower_node.addDecorator(PrimeTowerRepresentationDecorator())
@@ -498,7 +715,7 @@ class DragOnTower(Extension, QObject):
             self._prime_tower_node.transformationChanged.connect(self._onNodeTransformChanged)
 
         finally:
-            self._settings_update_in_progress = False
+            self._settings_update_in_progress = was_updating
             self._creating_prime_tower = False
     
     def _removePrimeTowerNode(self):
@@ -515,6 +732,7 @@ class DragOnTower(Extension, QObject):
             Selection.remove(self._prime_tower_node)
         
         self._scene.getRoot().removeChild(self._prime_tower_node)
+        self._all_prime_tower_nodes.discard(self._prime_tower_node)
         self._prime_tower_node = None
         self._prime_tower_was_selected = False
     
@@ -524,34 +742,46 @@ class DragOnTower(Extension, QObject):
         if self._prime_tower_node:
             self._removePrimeTowerNode()
         
-        # Then search for any orphaned prime tower nodes and remove them
         root = self._scene.getRoot()
-        nodes_to_remove = []
         
-        for node in root.getChildren():
-            # Check if it's a prime tower by name or decorator
-            if node.getName() == "Prime Tower Visual":
-                nodes_to_remove.append(node)
-            else:
-                # Check for PrimeTowerRepresentationDecorator
-                for decorator in node.getDecorators():
-                    if hasattr(decorator, 'isPrimeTowerRepresentation') and decorator.isPrimeTowerRepresentation():
-                        nodes_to_remove.append(node)
-                        break
-        
-        # Remove all found nodes
-        for node in nodes_to_remove:
-            try:
-                if Selection.isSelected(node):
-                    Selection.remove(node)
-                root.removeChild(node)
-            except Exception as e:
-                Logger.log("w", f"Failed to remove prime tower node: {e}")
+        # Then remove every node we created that is still in the scene
+        for node in list(self._all_prime_tower_nodes):
+            self._all_prime_tower_nodes.discard(node)
+            if node.getParent() is not None:
+                self._detachPrimeTowerNode(root, node)
+        
+        # Only fall back to searching for orphaned prime tower nodes when some may exist
+        if self._orphan_scan_needed:
+            self._orphan_scan_needed = False
+            nodes_to_remove = []
+            
+            for node in root.getChildren():
+                # Check if it's a prime tower by name or decorator
+                if node.getName() == "Prime Tower Visual":
+                    nodes_to_remove.append(node)
+                else:
+                    # Check for PrimeTowerRepresentationDecorator
+                    for decorator in node.getDecorators():
+                        if isinstance(decorator, PrimeTowerRepresentationDecorator):
+                            nodes_to_remove.append(node)
+                            break
+            
+            for node in nodes_to_remove:
+                self._detachPrimeTowerNode(root, node)
         
         # Ensure our reference is cleared
         self._prime_tower_node = None
         self._prime_tower_was_selected = False
     
+    def _detachPrimeTowerNode(self, root: SceneNode, node: SceneNode):
+        """Deselect and remove a single prime tower node from the scene root."""
+        try:
+            if Selection.isSelected(node):
+                Selection.remove(node)
+            root.removeChild(node)
+        except Exception as e:
+            Logger.log("w", f"Failed to remove prime tower node: {e}")
+    
     def _generateTowerMesh(self):
         """Generate tower mesh based on current settings.
         
@@ -598,6 +828,8 @@ class DragOnTower(Extension, QObject):
         if not self._prime_tower_node or not self._global_stack:
             return
         
+        # Restore rather than clear the flag so nested calls keep the caller's guard active
+        was_updating = self._settings_update_in_progress
         self._settings_update_in_progress = True
         
         try:
@@ -609,13 +841,14 @@ class DragOnTower(Extension, QObject):
                 # Update position after mesh change
                 self._updateNodePosition()        
         finally:
-            self._settings_update_in_progress = False
+            self._settings_update_in_progress = was_updating
     
     def _updateNodePosition(self):
         """Update node position from prime tower position settings."""
         if not self._prime_tower_node or not self._global_stack:
             return
         
+        was_updating = self._settings_update_in_progress
         self._settings_update_in_progress = True
         
         try:
@@ -623,27 +856,21 @@ class DragOnTower(Extension, QObject):
             setting_x = self._global_stack.getProperty("prime_tower_position_x", "value")
             setting_y = self._global_stack.getProperty("prime_tower_position_y", "value")
             
-            scene_x = setting_x
-            scene_z = -setting_y
+            scene_x, scene_z = self._settingsToScene(
+                setting_x, setting_y, tower_size, self._machine_offset_x, self._machine_offset_z)
             
-            if not self._machine_center_is_zero:
-                scene_x = scene_x - self._machine_width / 2
-                scene_z = scene_z + self._machine_depth / 2
-            
-            radius = tower_size / 2.0
-            scene_x -= radius
-            scene_z -= radius
-            
-            gravity_op = GravityOperation(self._prime_tower_node)
-            gravity_op.redo()
-            self._build_plate_y = float(self._prime_tower_node.getPosition().y)
+            self._build_plate_y = _TOWER_MESH_BOTTOM_Y
             
             position = Vector(scene_x, self._build_plate_y, scene_z)
             self._prime_tower_node.setPosition(position, SceneNode.TransformSpace.World)
             self._checkTowerCollision()
         
         finally:
-            self._settings_update_in_progress = False
+            self._settings_update_in_progress = was_updating
+    
+    def _onBuildVolumeRebuilt(self, build_volume: SceneNode):
+        """Refresh collision state once BuildVolume has recomputed its error areas."""
+        self._checkTowerCollision()
     
     def _checkTowerCollision(self):
         """Check BuildVolume's error areas to determine if prime tower is in invalid position."""
@@ -659,11 +886,17 @@ class DragOnTower(Extension, QObject):
             
             if has_errors != ProtectedSceneNode.collision_detected:
                 ProtectedSceneNode.collision_detected = has_errors
-                # Force a re-render by marking node as changed
-                self._prime_tower_node.transformationChanged.emit(self._prime_tower_node)
+                # Only the color changed, so a redraw is enough
+                self._requestRedraw()
         except Exception as e:
             Logger.log("w", f"Error checking BuildVolume error state: {e}")
     
+    def _requestRedraw(self):
+        """Schedule a repaint of the main window without touching the scene graph."""
+        main_window = self._application.getMainWindow()
+        if main_window:
+            main_window.update()
+    
     def _onNodeTransformChanged(self, node: SceneNode):
         """Constrain transforms and sync to settings when node is modified."""
         if not self._prime_tower_node or node != self._prime_tower_node or self._settings_update_in_progress:
@@ -673,49 +906,153 @@ class DragOnTower(Extension, QObject):
         
         try:
             position = self._prime_tower_node.getWorldPosition()
-            orientation = self._prime_tower_node.getOrientation()
-            
-            identity_orientation = Quaternion()
-            if orientation != identity_orientation:
-                self._prime_tower_node.setOrientation(identity_orientation)
+            px, py, pz = position.x, position.y, position.z
+            if self._prime_tower_node.getOrientation() != self._IDENTITY_ORIENTATION:
+                self._prime_tower_node.setOrientation(self._IDENTITY_ORIENTATION)
             
             constrained_y = self._build_plate_y
-            bbox = self._prime_tower_node.getBoundingBox()
-            if bbox:
-                tower_radius = max(bbox.width, bbox.depth) / 2.0
+            footprint = self._getTowerFootprint()
+            if footprint:
+                tower_radius = footprint * 0.5
             else:
                 tower_radius = self.DEFAULT_TOWER_RADIUS
             
-            min_x = -self._machine_width / 2.0 + tower_radius
-            max_x = self._machine_width / 2.0 - tower_radius
-            min_z = -self._machine_depth / 2.0 + tower_radius
-            max_z = self._machine_depth / 2.0 - tower_radius
+            min_x = -self._machine_half_width + tower_radius
+            max_x = self._machine_half_width - tower_radius
+            min_z = -self._machine_half_depth + tower_radius
+            max_z = self._machine_half_depth - tower_radius
             
-            constrained_x = max(min_x, min(position.x, max_x))
-            constrained_z = max(min_z, min(position.z, max_z))
+            constrained_x = self._clamp(px, min_x, max_x)
+            constrained_z = self._clamp(pz, min_z, max_z)
             
-            if (abs(position.y - constrained_y) > self.POSITION_TOLERANCE or 
-                abs(position.x - constrained_x) > self.POSITION_TOLERANCE or 
-                abs(position.z - constrained_z) > self.POSITION_TOLERANCE):
+            dx = px - constrained_x
+            dy = py - constrained_y
+            dz = pz - constrained_z
+            if dx * dx + dy * dy + dz * dz > self.POSITION_TOLERANCE_SQ:
                 constrained_position = Vector(float(constrained_x), float(constrained_y), float(constrained_z))
                 self._prime_tower_node.setPosition(constrained_position, SceneNode.TransformSpace.World)
             
-            self._updateSettingsFromNode()
-            self._checkTowerCollision()
+            self._schedulePendingUpdate()
         finally:
             self._settings_update_in_progress = False
     
+    @staticmethod
+    def _settingsToScene(
+        setting_x: float,
+        setting_y: float,
+        tower_size: float,
+        offset_x: float,
+        offset_z: float
+    ) -> Tuple[float, float]:
+        """Convert prime tower position settings to the node's scene X/Z position.
+        
+        Args:
+            setting_x: prime_tower_position_x
+            setting_y: prime_tower_position_y
+            tower_size: prime_tower_size (the setting position is offset by its radius)
+            offset_x: Settings X minus scene X for the current machine origin
+            offset_z: Scene Z plus settings Y for the current machine origin
+            
+        Returns:
+            Tuple of (scene_x, scene_z)
+        """
+        radius = tower_size * 0.5
+        return setting_x - offset_x - radius, offset_z - setting_y - radius
+    
+    @staticmethod
+    def _sceneToSettings(
+        scene_x: float,
+        scene_z: float,
+        tower_size: float,
+        offset_x: float,
+        offset_z: float
+    ) -> Tuple[float, float]:
+        """Convert the node's scene X/Z position to prime tower position settings.
+        
+        Inverse of _settingsToScene.
+        
+        Returns:
+            Tuple of (prime_tower_position_x, prime_tower_position_y)
+        """
+        radius = tower_size * 0.5
+        return scene_x + radius + offset_x, offset_z - scene_z - radius
+    
+    @staticmethod
+    def _clamp(value: float, minimum: float, maximum: float) -> float:
+        """Clamp value to [minimum, maximum], preferring minimum if the range is empty."""
+        if value > maximum:
+            value = maximum
+        return minimum if value < minimum else value
+    
+    def _getLocalTowerDiameter(self) -> float:
+        """Return the unscaled footprint diameter of the current tower mesh, base included.
+        
+        The mesh is generated from the stored settings with a vertex on each axis, so its
+        footprint follows directly from them instead of reading the mesh extents.
+        """
+        if self._original_base_size > 0 and self._original_base_height > 0:
+            return self._original_mesh_diameter + 2.0 * self._original_base_size
+        return self._original_mesh_diameter
+    
+    def _getTowerFootprint(self) -> Optional[float]:
+        """Return the world-space footprint diameter of the tower node, base included."""
+        if not self._prime_tower_node.getMeshData():
+            return None
+        
+        diameter = self._getLocalTowerDiameter()
+        if diameter <= 0:
+            return None
+        
+        scale = self._prime_tower_node.getScale()
+        return diameter * max(scale.x, scale.z)
+    
+    def _schedulePendingUpdate(self):
+        """Mark the settings as out of date and (re)start the coalescing timer."""
+        self._settings_update_pending = True
+        self._pending_update_timer.start()
+    
+    def _flushPendingUpdate(self):
+        """Write the tower node state to the settings once the transform burst has settled."""
+        if not self._settings_update_pending:
+            return
+        
+        self._settings_update_pending = False
+        self._updateSettingsFromNode()
+    
+    def _iterSliceableNodes(self) -> Iterator[SceneNode]:
+        """Yield every sliceable node with mesh data in the scene, excluding the prime tower."""
+        prime_tower_node = self._prime_tower_node
+        for node in self._scene.getRoot().getAllChildren():
+            # Cheap identity and attribute checks first; decorator dispatch walks every decorator
+            if node is prime_tower_node or not node.getMeshData() or not node.callDecoration("isSliceable"):
+                continue
+            yield node
+    
     def _getMaxModelHeight(self) -> float:
-        """Get the maximum height of all sliceable objects in the scene."""
+        """Get the maximum height of all sliceable objects in the scene.
+        
+        Only the height is cached, not the nodes, so removed objects can still be collected.
+        It is recomputed after the scene version changes.
+        """
+        if self._max_model_height_version == self._scene_version:
+            return self._max_model_height
+        
         max_height = 0.0
-        for node in self._scene.getRoot().getAllChildren():
-            if node.callDecoration("isSliceable") and node.getMeshData():
-                bbox = node.getBoundingBox()
-                if bbox:
-                    node_height = bbox.maximum.y
-                    if node_height > max_height:
-                        max_height = node_height
-        return float(max_height)
+        for node in self._iterSliceableNodes():
+            bbox = node.getBoundingBox()
+            if bbox and bbox.top > max_height:
+                max_height = bbox.top
+        
+        self._max_model_height = float(max_height)
+        self._max_model_height_version = self._scene_version
+        return self._max_model_height
+    
+    def _trackSliceableObjects(self):
+        """Start tracking transforms of every sliceable object already in the scene."""
+        for node in self._iterSliceableNodes():
+            if node not in self._tracked_objects:
+                self._tracked_objects.add(node)
+                node.transformationChanged.connect(self._onSliceableObjectTransformed)
     
     def _updateSettingsFromNode(self):
         """Update prime tower settings from node position and scale.
@@ -730,10 +1067,7 @@ class DragOnTower(Extension, QObject):
         self._settings_update_in_progress = True
         
         try:
-            # Check if scale tool is currently active
-            controller = self._application.getController()
-            active_tool = controller.getActiveTool()
-            scale_tool_active = active_tool and active_tool.getPluginId() == "ScaleTool"
+            scale_tool_active = self._scale_tool_active
             
             # Check for scale transformation
             scale = self._prime_tower_node.getScale()
@@ -756,7 +1090,7 @@ class DragOnTower(Extension, QObject):
                     # Tool not active - apply scale immediately
                     new_tower_size = self._original_mesh_diameter * scale_factor
                     self._global_stack.setProperty("prime_tower_size", "value", new_tower_size)
-                    self._prime_tower_node.setScale(Vector(1.0, 1.0, 1.0))
+                    self._prime_tower_node.setScale(self._UNIT_SCALE)
                     return
             
             # Don't update position while scale tool is active (prevents shadow movement)
@@ -765,23 +1099,24 @@ class DragOnTower(Extension, QObject):
             
             # Only update position
             position = self._prime_tower_node.getWorldPosition()
-            tower_size = self._original_mesh_diameter
+            setting_x, setting_y = self._sceneToSettings(
+                position.x, position.z, self._original_mesh_diameter, self._machine_offset_x, self._machine_offset_z)
             
-            radius = tower_size / 2.0
-            corner_x = position.x + radius
-            corner_z = position.z + radius
-            
-            setting_x = corner_x
-            setting_z = corner_z
-            
-            if not self._machine_center_is_zero:
-                setting_x = setting_x + self._machine_width / 2
-                setting_z = setting_z - self._machine_depth / 2
-            
-            setting_y = -setting_z
+            # Skip coordinates that have not moved since our last write
+            last_position = self._last_written_position
+            write_x = last_position is None or abs(setting_x - last_position[0]) > self.POSITION_TOLERANCE
+            write_y = last_position is None or abs(setting_y - last_position[1]) > self.POSITION_TOLERANCE
+            if not (write_x or write_y):
+                return
             
-            self._global_stack.setProperty("prime_tower_position_x", "value", setting_x)
-            self._global_stack.setProperty("prime_tower_position_y", "value", setting_y)
+            if write_x:
+                self._global_stack.setProperty("prime_tower_position_x", "value", setting_x)
+            if write_y:
+                self._global_stack.setProperty("prime_tower_position_y", "value", setting_y)
+            self._last_written_position = (
+                setting_x if write_x else last_position[0],
+                setting_y if write_y else last_position[1]
+            )
         
         finally:
             self._settings_update_in_progress = False
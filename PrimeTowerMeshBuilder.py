@@ -7,18 +7,40 @@
 # (at your option) any later version.
 
 import math
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import numpy
 
-from UM.Mesh.MeshBuilder import MeshBuilder
 from UM.Mesh.MeshData import MeshData
 from UM.Logger import Logger
 
 
+@lru_cache(maxsize=None)
+def _buildUnitCircle(segments: int) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """Return the cos and sin arrays of a circle split into the given number of segments.
+    
+    The read-only arrays are shared by every ring built with the same segment count.
+    """
+    angles = numpy.arange(segments) * (math.tau / segments)
+    # Stored as float32, the vertex precision of MeshData, so ring products need no downcast
+    cos_angles = numpy.cos(angles).astype(numpy.float32)
+    sin_angles = numpy.sin(angles).astype(numpy.float32)
+    cos_angles.setflags(write=False)
+    sin_angles.setflags(write=False)
+    return cos_angles, sin_angles
+
+
 class PrimeTowerMeshBuilder:
     """Builds a mesh representation of the prime tower based on Cura settings."""
     
-    # Number of segments for cylinder approximation
-    SEGMENTS = 32
+    # Number of segments for cylinder approximation, scaled with the outer circumference
+    MIN_SEGMENTS = 8
+    MAX_SEGMENTS = 64
+    SEGMENT_LENGTH = 1.0  # Target outer edge length (mm)
+    
+    # Mesh parameters are rounded to this many decimals (0.01mm) before cache lookup
+    CACHE_PRECISION = 2
     
     @staticmethod
     def buildPrimeTowerMesh(
@@ -41,28 +63,60 @@ class PrimeTowerMeshBuilder:
         Returns:
             MeshData object representing the tower, or None on failure
         """
+        # Rounded so that slider drags and repeated scene updates hit the cache
+        precision = PrimeTowerMeshBuilder.CACHE_PRECISION
+        return PrimeTowerMeshBuilder._buildCachedPrimeTowerMesh(
+            round(tower_size, precision),
+            round(tower_height, precision),
+            round(base_size, precision),
+            round(base_height, precision),
+            round(base_curve_magnitude, precision),
+            round(layer_height, precision)
+        )
+    
+    @staticmethod
+    def clearCache() -> None:
+        """Drop all memoized tower meshes."""
+        PrimeTowerMeshBuilder._buildCachedPrimeTowerMesh.cache_clear()
+    
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _buildCachedPrimeTowerMesh(
+        tower_size: float,
+        tower_height: float,
+        base_size: float,
+        base_height: float,
+        base_curve_magnitude: float,
+        layer_height: float
+    ) -> Optional[MeshData]:
+        """Build a prime tower mesh, reusing the result for previously seen parameters."""
         try:
             tower_radius = tower_size / 2.0
-            # Base size is the margin beyond the tower edge, so add it to the tower radius
-            base_radius = tower_radius + base_size if base_size > 0 else tower_radius
+            # Nothing to show for an empty tower; skip building a degenerate mesh
+            if tower_radius <= 0 or tower_height <= 0:
+                return None
             
             # Calculate transition zone if there's a base
             has_base = base_size > 0 and base_height > 0
             
             if has_base:
+                # Base size is the margin beyond the tower edge, so add it to the tower radius
+                base_radius = tower_radius + base_size
                 return PrimeTowerMeshBuilder._buildTowerWithBase(
                     tower_radius=tower_radius,
                     tower_height=tower_height,
                     base_radius=base_radius,
                     base_height=base_height,
                     base_curve_magnitude=base_curve_magnitude,
-                    layer_height=layer_height
+                    layer_height=layer_height,
+                    segments=PrimeTowerMeshBuilder._getSegmentCount(base_radius)
                 )
             else:
                 # Simple cylinder without base
                 return PrimeTowerMeshBuilder._buildSimpleCylinder(
                     radius=tower_radius,
-                    height=tower_height
+                    height=tower_height,
+                    segments=PrimeTowerMeshBuilder._getSegmentCount(tower_radius)
                 )
                 
         except Exception as e:
@@ -70,60 +124,25 @@ class PrimeTowerMeshBuilder:
             return None
     
     @staticmethod
-    def _buildSimpleCylinder(radius: float, height: float) -> MeshData:
+    def _getSegmentCount(outer_radius: float) -> int:
+        """Return the number of ring segments for a tower with the given outer radius.
+        
+        Small towers get fewer segments, large ones more, so edges stay close to SEGMENT_LENGTH.
+        The count is a multiple of 4 so that every ring has a vertex on both axes, keeping the
+        mesh extents equal to its diameter.
+        """
+        segments = math.ceil(math.tau * outer_radius / PrimeTowerMeshBuilder.SEGMENT_LENGTH)
+        segments = 4 * math.ceil(segments / 4)
+        return max(PrimeTowerMeshBuilder.MIN_SEGMENTS, min(PrimeTowerMeshBuilder.MAX_SEGMENTS, segments))
+    
+    @staticmethod
+    def _buildSimpleCylinder(radius: float, height: float, segments: int) -> MeshData:
         """Build a simple cylindrical tower."""
-        builder = MeshBuilder()
-        
-        angle_step = 2 * math.pi / PrimeTowerMeshBuilder.SEGMENTS
-        
-        # Generate vertices for bottom and top rings
-        bottom_verts = []
-        top_verts = []
-        
-        for i in range(PrimeTowerMeshBuilder.SEGMENTS):
-            angle = i * angle_step
-            x = radius * math.cos(angle)
-            z = radius * math.sin(angle)
-            bottom_verts.append((x, 0, z))
-            top_verts.append((x, height, z))
-        
-        # Build bottom cap (triangles from center to ring) - CCW when viewed from below
-        for i in range(PrimeTowerMeshBuilder.SEGMENTS):
-            next_i = (i + 1) % PrimeTowerMeshBuilder.SEGMENTS
-            builder.addFaceByPoints(
-                0, 0, 0,  # Center
-                bottom_verts[i][0], bottom_verts[i][1], bottom_verts[i][2],
-                bottom_verts[next_i][0], bottom_verts[next_i][1], bottom_verts[next_i][2]
-            )
-        
-        # Build side faces (quads as two triangles)
-        for i in range(PrimeTowerMeshBuilder.SEGMENTS):
-            next_i = (i + 1) % PrimeTowerMeshBuilder.SEGMENTS
-            
-            # Triangle 1
-            builder.addFaceByPoints(
-                bottom_verts[i][0], bottom_verts[i][1], bottom_verts[i][2],
-                bottom_verts[next_i][0], bottom_verts[next_i][1], bottom_verts[next_i][2],
-                top_verts[i][0], top_verts[i][1], top_verts[i][2]
-            )
-            # Triangle 2
-            builder.addFaceByPoints(
-                top_verts[i][0], top_verts[i][1], top_verts[i][2],
-                bottom_verts[next_i][0], bottom_verts[next_i][1], bottom_verts[next_i][2],
-                top_verts[next_i][0], top_verts[next_i][1], top_verts[next_i][2]
-            )
-        
-        # Build top cap (triangles from center to ring)
-        for i in range(PrimeTowerMeshBuilder.SEGMENTS):
-            next_i = (i + 1) % PrimeTowerMeshBuilder.SEGMENTS
-            builder.addFaceByPoints(
-                0, height, 0,  # Center
-                top_verts[i][0], top_verts[i][1], top_verts[i][2],
-                top_verts[next_i][0], top_verts[next_i][1], top_verts[next_i][2]
-            )
-        
-        builder.calculateNormals()
-        return builder.build()
+        # Bottom and top rings
+        ring_radii = numpy.array((radius, radius))
+        ring_heights = numpy.array((0.0, height))
+        
+        return PrimeTowerMeshBuilder._buildRingStackMesh(ring_radii, ring_heights, segments)
     
     @staticmethod
     def _buildTowerWithBase(
@@ -132,7 +151,8 @@ class PrimeTowerMeshBuilder:
         base_radius: float,
         base_height: float,
         base_curve_magnitude: float,
-        layer_height: float
+        layer_height: float,
+        segments: int
     ) -> MeshData:
         """Build a tower with a wider base using power curve slope.
         
@@ -140,104 +160,182 @@ class PrimeTowerMeshBuilder:
         At z=0 (bottom): full base_radius
         At z=base_height (top of base): tower_radius
         """
-        builder = MeshBuilder()
-        
-        angle_step = 2 * math.pi / PrimeTowerMeshBuilder.SEGMENTS
-        
         # Generate enough layers for smooth visual curve
         # Use layer_height as a guide but ensure minimum smoothness
         layers_from_height = int(base_height / layer_height)
         num_base_layers = max(layers_from_height, 10)  # At least 10 layers for smooth curve
         
-        # Generate all vertex layers
-        layers = []
+        # Base layers with power curve; the last one lands on base_height with tower_radius
+        base_extra_radius = base_radius - tower_radius
+        z_ratios = numpy.arange(1, num_base_layers + 1) / num_base_layers
+        z_heights = base_height * z_ratios
         
-        # Layer 0: Base bottom with base_radius
-        layer_verts = []
-        for i in range(PrimeTowerMeshBuilder.SEGMENTS):
-            angle = i * angle_step
-            x = base_radius * math.cos(angle)
-            z = base_radius * math.sin(angle)
-            layer_verts.append((x, 0.0, z))
-        layers.append((0.0, layer_verts))
+        # Apply Cura's power curve formula to all base layers at once
+        brim_radius_factors = numpy.power(1.0 - z_ratios, base_curve_magnitude)
+        layer_radii = tower_radius + base_extra_radius * brim_radius_factors
+        # The curve only reaches tower_radius for positive magnitudes (0 ** 0 == 1, 0 ** -k == inf)
+        layer_radii[-1] = tower_radius
         
-        # Intermediate base layers with power curve
-        base_extra_radius = base_radius - tower_radius
-        for layer_idx in range(1, num_base_layers):
-            z_height = base_height * (layer_idx / num_base_layers)
+        # All rings: base bottom with base_radius, power curve layers, tower top with tower_radius
+        ring_radii = numpy.concatenate(((base_radius,), layer_radii, (tower_radius,)))
+        ring_heights = numpy.concatenate(((0.0,), z_heights, (tower_height,)))
+        
+        return PrimeTowerMeshBuilder._buildRingStackMesh(ring_radii, ring_heights, segments)
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _buildCapFan(segments: int) -> numpy.ndarray:
+        """Return the fan triangles of a cap whose rim vertices are followed by its center vertex.
+        
+        Both caps share this template; it is offset to the cap's first rim vertex when used.
+        
+        Args:
+            segments: Number of rim vertices
+            
+        Returns:
+            (segments, 3) int32 array of cap-relative vertex indices
+        """
+        rim = numpy.arange(segments, dtype=numpy.int32)
+        cap_fan = numpy.column_stack((numpy.full(segments, segments, dtype=numpy.int32), rim, (rim + 1) % segments))
+        cap_fan.setflags(write=False)
+        return cap_fan
+    
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _buildFaceIndices(num_rings: int, segments: int) -> numpy.ndarray:
+        """Return the triangles of a stack of rings closed by a fan cap at the bottom and top.
+        
+        Indices refer to the flattened rings, followed by the bottom cap rim and center and then
+        the top cap rim and center. The caps get their own rim vertices so their normals stay flat.
+        The topology only depends on the ring and segment counts, so the read-only result is shared
+        between builds.
+        
+        Args:
+            num_rings: Number of rings in the stack, bottom to top
+            segments: Number of vertices per ring
             
-            # Apply Cura's power curve formula
-            z_ratio = z_height / base_height
-            brim_radius_factor = pow(1.0 - z_ratio, base_curve_magnitude)
-            extra_radius = base_extra_radius * brim_radius_factor
-            layer_radius = tower_radius + extra_radius
+        Returns:
+            (faces, 3) int32 array of vertex indices
+        """
+        current = numpy.arange(segments, dtype=numpy.int32)
+        following = (current + 1) % segments
+        bottom_rim = num_rings * segments
+        top_rim = bottom_rim + segments + 1
+        cap_fan = PrimeTowerMeshBuilder._buildCapFan(segments)
+        
+        # Two triangles per quad between a ring and the one above it, repeated for every ring pair
+        quads = numpy.stack((
+            numpy.column_stack((current, following, current + segments)),
+            numpy.column_stack((current + segments, following, following + segments))
+        ), axis=1).reshape(-1, 3)
+        ring_offsets = numpy.arange(num_rings - 1, dtype=numpy.int32)[:, None, None] * segments
+        sides = (quads[None, :, :] + ring_offsets).reshape(-1, 3)
+        
+        indices = numpy.concatenate((cap_fan + bottom_rim, sides, cap_fan + top_rim)).astype(numpy.int32, copy=False)
+        indices.setflags(write=False)
+        return indices
+    
+    @staticmethod
+    def _buildRingVertices(ring_radii: numpy.ndarray, ring_heights: numpy.ndarray, segments: int) -> numpy.ndarray:
+        """Return the vertices of horizontal rings with the given radii and heights.
+        
+        Args:
+            ring_radii: Radius of every ring, ordered bottom to top
+            ring_heights: Height of every ring, ordered bottom to top
+            segments: Number of vertices per ring
             
-            layer_verts = []
-            for i in range(PrimeTowerMeshBuilder.SEGMENTS):
-                angle = i * angle_step
-                x = layer_radius * math.cos(angle)
-                z = layer_radius * math.sin(angle)
-                layer_verts.append((x, z_height, z))
-            layers.append((z_height, layer_verts))
-        
-        # Layer at base_height: Transition to tower_radius
-        layer_verts = []
-        for i in range(PrimeTowerMeshBuilder.SEGMENTS):
-            angle = i * angle_step
-            x = tower_radius * math.cos(angle)
-            z = tower_radius * math.sin(angle)
-            layer_verts.append((x, base_height, z))
-        layers.append((base_height, layer_verts))
-        
-        # Top layer: Tower top with tower_radius
-        layer_verts = []
-        for i in range(PrimeTowerMeshBuilder.SEGMENTS):
-            angle = i * angle_step
-            x = tower_radius * math.cos(angle)
-            z = tower_radius * math.sin(angle)
-            layer_verts.append((x, tower_height, z))
-        layers.append((tower_height, layer_verts))
-        
-        # Build bottom cap - CCW when viewed from below for correct normals
-        bottom_verts = layers[0][1]
-        for i in range(PrimeTowerMeshBuilder.SEGMENTS):
-            next_i = (i + 1) % PrimeTowerMeshBuilder.SEGMENTS
-            builder.addFaceByPoints(
-                0, 0, 0,  # Center
-                bottom_verts[i][0], bottom_verts[i][1], bottom_verts[i][2],
-                bottom_verts[next_i][0], bottom_verts[next_i][1], bottom_verts[next_i][2]
-            )
-        
-        # Build side faces between all consecutive layers
-        for layer_idx in range(len(layers) - 1):
-            curr_height, curr_verts = layers[layer_idx]
-            next_height, next_verts = layers[layer_idx + 1]
+        Returns:
+            (num_rings, segments, 3) float32 array of ring vertices
+        """
+        cos_angles, sin_angles = _buildUnitCircle(segments)
+        ring_radii = ring_radii.astype(numpy.float32, copy=False)
+        rings = numpy.empty((len(ring_radii), segments, 3), dtype=numpy.float32)
+        rings[:, :, 0] = ring_radii[:, None] * cos_angles
+        rings[:, :, 1] = ring_heights[:, None]
+        rings[:, :, 2] = ring_radii[:, None] * sin_angles
+        return rings
+    
+    @staticmethod
+    def _buildRingNormals(ring_radii: numpy.ndarray, ring_heights: numpy.ndarray, segments: int) -> numpy.ndarray:
+        """Return the outward surface normals of the side rings of a surface of revolution.
+        
+        The normal at a ring is (cos, -dr/dy, sin), normalized, where dr/dy is the change of
+        radius over height averaged from the bands above and below the ring.
+        
+        Args:
+            ring_radii: Radius of every ring, ordered bottom to top
+            ring_heights: Height of every ring, ordered bottom to top
+            segments: Number of vertices per ring
             
-            for i in range(PrimeTowerMeshBuilder.SEGMENTS):
-                next_i = (i + 1) % PrimeTowerMeshBuilder.SEGMENTS
-                # Triangle 1
-                builder.addFaceByPoints(
-                    curr_verts[i][0], curr_verts[i][1], curr_verts[i][2],
-                    curr_verts[next_i][0], curr_verts[next_i][1], curr_verts[next_i][2],
-                    next_verts[i][0], next_verts[i][1], next_verts[i][2]
-                )
-                # Triangle 2
-                builder.addFaceByPoints(
-                    next_verts[i][0], next_verts[i][1], next_verts[i][2],
-                    curr_verts[next_i][0], curr_verts[next_i][1], curr_verts[next_i][2],
-                    next_verts[next_i][0], next_verts[next_i][1], next_verts[next_i][2]
-                )
+        Returns:
+            (num_rings, segments, 3) float32 array of unit normals
+        """
+        num_rings = len(ring_radii)
+        band_rise = numpy.diff(ring_heights)
+        band_slopes = numpy.divide(
+            numpy.diff(ring_radii), band_rise, out=numpy.zeros(num_rings - 1), where=band_rise > 0)
+        ring_slopes = numpy.empty(num_rings)
+        ring_slopes[0] = band_slopes[0]
+        ring_slopes[-1] = band_slopes[-1]
+        ring_slopes[1:-1] = 0.5 * (band_slopes[:-1] + band_slopes[1:])
+        
+        horizontal = 1.0 / numpy.sqrt(1.0 + ring_slopes * ring_slopes)
+        cos_angles, sin_angles = _buildUnitCircle(segments)
+        normals = numpy.empty((num_rings, segments, 3), dtype=numpy.float32)
+        normals[:, :, 0] = horizontal[:, None] * cos_angles
+        normals[:, :, 1] = (-ring_slopes * horizontal)[:, None]
+        normals[:, :, 2] = horizontal[:, None] * sin_angles
+        return normals
+    
+    @staticmethod
+    def _buildRingStackArrays(
+        ring_radii: numpy.ndarray,
+        ring_heights: numpy.ndarray,
+        segments: int
+    ) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """Return the vertices, normals and triangle indices of a capped stack of rings.
+        
+        Args:
+            ring_radii: Radius of every ring, ordered bottom to top
+            ring_heights: Height of every ring, ordered bottom to top
+            segments: Number of vertices per ring
+            
+        Returns:
+            Tuple of the (vertices, 3) float32 vertex and normal arrays and the (faces, 3) int32 index array
+        """
+        num_rings = len(ring_radii)
+        rings = PrimeTowerMeshBuilder._buildRingVertices(ring_radii, ring_heights, segments)
+        centers = numpy.zeros((2, 3), dtype=numpy.float32)
+        centers[0, 1] = ring_heights[0]
+        centers[1, 1] = ring_heights[-1]
+        # Side rings are shared by the faces above and below them; only the cap rims are repeated
+        points = numpy.concatenate((rings.reshape(-1, 3), rings[0], centers[:1], rings[-1], centers[1:]))
         
-        # Build top cap
-        top_verts = layers[-1][1]
-        top_height = layers[-1][0]
-        for i in range(PrimeTowerMeshBuilder.SEGMENTS):
-            next_i = (i + 1) % PrimeTowerMeshBuilder.SEGMENTS
-            builder.addFaceByPoints(
-                0, top_height, 0,  # Center
-                top_verts[i][0], top_verts[i][1], top_verts[i][2],
-                top_verts[next_i][0], top_verts[next_i][1], top_verts[next_i][2]
-            )
-        
-        builder.calculateNormals()
-        return builder.build()
+        # Caps are flat, so their rim and center all face straight down or up
+        cap_normals = numpy.zeros((2, segments + 1, 3), dtype=numpy.float32)
+        cap_normals[0, :, 1] = -1.0
+        cap_normals[1, :, 1] = 1.0
+        normals = numpy.concatenate((
+            PrimeTowerMeshBuilder._buildRingNormals(ring_radii, ring_heights, segments).reshape(-1, 3),
+            cap_normals[0],
+            cap_normals[1]
+        ))
+        
+        return points, normals, PrimeTowerMeshBuilder._buildFaceIndices(num_rings, segments)
+    
+    @staticmethod
+    def _buildRingStackMesh(ring_radii: numpy.ndarray, ring_heights: numpy.ndarray, segments: int) -> MeshData:
+        """Build the tower mesh from its rings in one batch instead of face by face.
+        
+        Normals are analytic, so no separate normal calculation pass over the faces is needed.
+        
+        Args:
+            ring_radii: Radius of every ring, ordered bottom to top
+            ring_heights: Height of every ring, ordered bottom to top
+            segments: Number of vertices per ring
+            
+        Returns:
+            MeshData with the sides and both caps
+        """
+        vertices, normals, indices = PrimeTowerMeshBuilder._buildRingStackArrays(ring_radii, ring_heights, segments)
+        return MeshData(vertices=vertices, normals=normals, indices=indices)